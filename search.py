@@ -7,19 +7,46 @@ Displays results in a paginated GUI with clickable links.
 Usage: pythonw search.py (Windows) or python search.py
 """
 import os
+import queue
 import threading
 import time
 import datetime
+import functools
+import hashlib
+import tempfile
+import math
 import webbrowser
 import json
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # optional: parses response bytes several times faster than json
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # optional: streams REST search pages, keeping only the fields we use
+except ImportError:
+    ijson = None
 
 # Config
 DEFAULT_DAYS = 90
 ITEMS_PER_PAGE = 25
 CONFIG_FILE = "label_config.json"
+GRAPHQL_URL = "https://api.github.com/graphql"
+DESC_CACHE_FILE = "desc_cache.json"
+DESC_CACHE_TTL = 24 * 3600  # seconds; repository descriptions rarely change
+SEARCH_RESULT_CAP = 1000  # GitHub search never returns more than this many results
+RATE_LIMIT_LOW = 5  # pause paging when fewer requests than this remain
+MAX_RATE_LIMIT_WAIT = 60  # seconds; never stall a search longer than this
+ETAG_CACHE_SIZE = 50  # REST search pages kept for conditional requests
+SEARCH_CACHE_DIR = "search_cache"
+SEARCH_CACHE_TTL = 10 * 60  # seconds a cached search stays fresh
+SEARCH_CACHE_MAX_BYTES = 50 * 1024 * 1024  # least recently used searches are evicted past this
 DEFAULT_TAGS = ["good first issue", "good-first-issue", "beginner"]
 
 TOP_LANGUAGES = [
@@ -28,11 +55,49 @@ TOP_LANGUAGES = [
     "Pascal / FreePascal"
 ]
 
+# Shared HTTP session: keep-alive connection pooling plus retries on transient errors.
+# 429 is left out: _send_with_budget waits for X-RateLimit-Reset and retries it
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "Accept": "application/vnd.github.v3+json",
+    "Accept-Encoding": "gzip",
+    "User-Agent": "FirstIssueSearch"
+})
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504],
+                      allowed_methods=frozenset({"GET", "POST"}))
+))
+
+_REPOS_API_PREFIX = "https://api.github.com/repos/"
+_REPOS_API_PREFIX_LEN = len(_REPOS_API_PREFIX)
+
+# (query, page) -> (ETag, parsed response, has next page) for REST search pages;
+# language workers share it, so every access holds _ETAG_LOCK
+_ETAG_CACHE = {}
+_ETAG_LOCK = threading.Lock()
+
+# Rate-limit resource ("search", "graphql") -> [requests remaining, reset epoch].
+# Shared by all language workers so parallel queries draw on one budget
+_RATE_LIMITS = {}
+_RATE_LIMIT_LOCK = threading.Lock()
+
+_config_cache = None
+_config_mtime = 0
+
 def _read_config():
-    """Load config from disk, preserving defaults when keys are missing or malformed."""
+    """Load config from disk, preserving defaults when keys are missing or malformed.
+
+    The parsed config is cached and only re-read when the file's mtime changes.
+    """
+    global _config_cache, _config_mtime
     cfg = {"labels": DEFAULT_TAGS.copy(), "token": ""}
     if os.path.exists(CONFIG_FILE):
         try:
+            mt = os.path.getmtime(CONFIG_FILE)
+            if _config_cache is not None and mt == _config_mtime:
+                return dict(_config_cache)
             with open(CONFIG_FILE, 'r') as f:
                 data = json.load(f)
             if isinstance(data, dict):
@@ -40,14 +105,34 @@ def _read_config():
                     cfg["labels"] = data["labels"]
                 if isinstance(data.get("token"), str):
                     cfg["token"] = data["token"]
+            _config_cache, _config_mtime = dict(cfg), mt
         except Exception:
             pass
     return cfg
 
+def _atomic_write_json(path, obj, **dump_kwargs):
+    """Write obj as JSON to path via a temp file swapped in with os.replace.
+
+    Readers never see a partial file, and the temp file is removed if writing
+    fails. Errors are re-raised for the caller to handle.
+    """
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(obj, f, **dump_kwargs)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
 def _write_config(cfg):
+    global _config_cache, _config_mtime
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(cfg, f, indent=2)
+        _atomic_write_json(CONFIG_FILE, cfg, indent=2)
+        _config_cache, _config_mtime = dict(cfg), os.path.getmtime(CONFIG_FILE)
         return True
     except Exception:
         return False
@@ -61,6 +146,8 @@ def load_labels():
 def save_labels(labels):
     """Save labels to config file, preserving other config values."""
     cfg = _read_config()
+    if cfg.get('labels') == labels:
+        return True
     cfg['labels'] = labels
     return _write_config(cfg)
 
@@ -71,45 +158,128 @@ def load_token():
 
 def save_token(token):
     cfg = _read_config()
+    if cfg.get('token') == token:
+        return True
     cfg['token'] = token
     return _write_config(cfg)
 
+def load_desc_cache():
+    """Load cached repository descriptions, dropping entries older than the TTL."""
+    cache = {}
+    if os.path.exists(DESC_CACHE_FILE):
+        try:
+            with open(DESC_CACHE_FILE, 'r') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                now = time.time()
+                for full_name, entry in data.items():
+                    if (isinstance(entry, dict) and isinstance(entry.get("description"), str)
+                            and now - entry.get("fetched_at", 0) < DESC_CACHE_TTL):
+                        cache[full_name] = entry
+        except Exception:
+            pass
+    return cache
+
+def save_desc_cache(cache):
+    try:
+        _atomic_write_json(DESC_CACHE_FILE, cache)
+        return True
+    except Exception:
+        return False
+
 def build_label_query(labels):
     """Build GitHub search query for labels. Uses first label only due to API limitations."""
     if not labels:
         return 'label:"good first issue"'
     return f'label:"{labels[0]}"'
 
+def utc_today():
+    """Return today's date in UTC (the timezone GitHub search dates use)."""
+    return datetime.datetime.now(datetime.timezone.utc).date()
+
+@functools.lru_cache(maxsize=8)
 def iso_date_days_ago(days):
-    """Return ISO date string for N days ago."""
-    dt = datetime.datetime.utcnow() - datetime.timedelta(days=days)
-    return dt.date().isoformat()
+    """Return ISO date string for N days ago.
+
+    Cached per day; call iso_date_days_ago.cache_clear() when the date rolls over.
+    """
+    return (utc_today() - datetime.timedelta(days=days)).isoformat()
+
+def parse_json(resp):
+    """Decode a JSON response body, using orjson on the raw bytes when installed."""
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+# Issue fields the REST search loop reads; everything else is skipped when streaming
+_SEARCH_ITEM_FIELDS = {
+    "items.item.id": "id",
+    "items.item.repository_url": "repository_url",
+    "items.item.updated_at": "updated_at",
+    "items.item.html_url": "html_url",
+}
+
+def parse_search_page(resp):
+    """Decode a REST search response into {"total_count", "items"}.
 
+    With ijson installed the body is streamed and each issue keeps only the
+    fields in _SEARCH_ITEM_FIELDS; otherwise the full JSON is parsed.
+    """
+    if ijson is None:
+        return parse_json(resp)
+    resp.raw.decode_content = True
+    total_count = 0
+    items = []
+    for prefix, event, value in ijson.parse(resp.raw):
+        if prefix == "items.item" and event == "start_map":
+            items.append({})
+        elif prefix in _SEARCH_ITEM_FIELDS:
+            items[-1][_SEARCH_ITEM_FIELDS[prefix]] = value
+        elif prefix == "total_count" and event == "number":
+            total_count = int(value)
+    return {"total_count": total_count, "items": items}
+
+@functools.lru_cache(maxsize=4)
 def gh_headers(token):
-    """Build GitHub API headers."""
-    headers = {"Accept": "application/vnd.github.v3+json"}
+    """Build per-request GitHub API headers (defaults live on the shared session).
+
+    The dict is cached and shared between callers, so copy it before adding keys.
+    """
+    headers = {}
     if token:
         headers["Authorization"] = f"token {token}"
     return headers
 
-def fetch_repo_description(owner, repo_name, token, timeout=5):
-    """Fetch repository description from GitHub API with short timeout."""
-    try:
-        url = f"https://api.github.com/repos/{owner}/{repo_name}"
-        resp = requests.get(url, headers=gh_headers(token), timeout=timeout)
-        if resp.status_code == 200:
-            data = resp.json()
-            return data.get("description", "") or ""
-        return ""
-    except Exception:
-        return ""
+SEARCH_QUERY = """
+query($q: String!, $cursor: String) {
+  search(query: $q, type: ISSUE, first: 100, after: $cursor) {
+    pageInfo { hasNextPage endCursor }
+    nodes {
+      ... on Issue {
+        url
+        updatedAt
+        repository { nameWithOwner url description isFork }
+      }
+    }
+  }
+}
+"""
 
-def search_open_beginner_issues(languages, days, labels, custom_terms, token, max_pages=10):
-    """Search GitHub for open issues matching criteria.
-    
-    Returns dict mapping repo name to issue data.
+def merge_search_page(repos_dict, page):
+    """Merge one page of search results into an accumulated repos dict."""
+    for full_name, data in page.items():
+        existing = repos_dict.get(full_name)
+        if existing is None:
+            repos_dict[full_name] = data
+        else:
+            existing["beginner_issues_count"] += data["beginner_issues_count"]
+
+def build_search_queries(languages, days, labels, custom_terms):
+    """Build the GitHub search query strings for the given criteria.
+
+    Returns one query per language (or a single query when no language is
+    selected) so each can be searched in parallel with its own 1000-result cap.
     """
-    url = "https://api.github.com/search/issues"
     updated_since = iso_date_days_ago(days)
     
     label_query = build_label_query(labels)
@@ -123,77 +293,326 @@ def search_open_beginner_issues(languages, days, labels, custom_terms, token, ma
     if custom_terms and custom_terms.strip():
         query_parts.append(custom_terms.strip())
     
-    # Add language filters
-    if languages:
-        # Expand special combined languages
-        expanded_langs = []
-        for lang in languages:
-            if lang == "Pascal / FreePascal":
-                expanded_langs.extend(["Pascal", "FreePascal"])
-            else:
-                expanded_langs.append(lang)
-                
-        # Quote languages if they contain spaces
-        formatted_langs = [f'language:"{l}"' if " " in l else f"language:{l}" for l in expanded_langs]
-        if len(formatted_langs) == 1:
-            query_parts.append(formatted_langs[0])
+    base_query = " ".join(query_parts)
+    if not languages:
+        return [base_query]
+    
+    # Expand special combined languages
+    expanded_langs = []
+    for lang in languages:
+        if lang == "Pascal / FreePascal":
+            expanded_langs.extend(["Pascal", "FreePascal"])
         else:
-            lang_query = "(" + " OR ".join(formatted_langs) + ")"
-            query_parts.append(lang_query)
+            expanded_langs.append(lang)
     
-    query = " ".join(query_parts)
-    repos_dict = {}
-    per_page = 100
+    # Quote languages if they contain spaces
+    return [f'{base_query} language:"{l}"' if " " in l else f"{base_query} language:{l}"
+            for l in dict.fromkeys(expanded_langs)]
+
+def iter_search_pages(languages, days, labels, custom_terms, token, max_pages=10):
+    """Search GitHub for open issues matching criteria, one result page at a time.
+
+    Each language is searched in its own worker thread; pages are yielded in
+    the order they arrive. Uses GraphQL (repository description inline) when a
+    token is available, otherwise falls back to the REST search API.
+
+    Yields a dict mapping repo name to issue data for each page fetched.
+    """
+    queries = build_search_queries(languages, days, labels, custom_terms)
+    if len(queries) == 1:
+        yield from _iter_query_pages(queries[0], token, max_pages)
+        return
+    
+    # Workers push pages (or their exception) onto a queue, so merging stays
+    # single-threaded in the consumer and needs no lock
+    results = queue.Queue()
+    stop = threading.Event()
+    done = object()
+    
+    pending = queue.Queue()
+    for query in queries:
+        pending.put(query)
     
+    def worker():
+        while not stop.is_set():
+            try:
+                query = pending.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                for page in _iter_query_pages(query, token, max_pages):
+                    results.put(page)
+                    if stop.is_set():
+                        break
+            except Exception as e:
+                results.put(e)
+            finally:
+                results.put(done)
+    
+    # Daemon threads, so a search in flight never keeps the process alive on exit
+    for _ in range(min(8, len(queries))):
+        threading.Thread(target=worker, daemon=True).start()
+    try:
+        remaining = len(queries)
+        while remaining:
+            item = results.get()
+            if item is done:
+                remaining -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield item
+    finally:
+        stop.set()
+
+def _iter_query_pages(query, token, max_pages):
+    """Yield result pages for one query, served from the disk cache while fresh."""
+    source = "graphql" if token else "rest"
+    key = hashlib.sha1(f"{source}|{query}|{max_pages}".encode()).hexdigest()
+    cached = load_search_cache(key)
+    if cached is not None:
+        for records in cached:
+            yield {rec["full_name"]: rec for rec in records}
+        return
+    
+    if token:
+        pages = _iter_graphql_pages(query, token, max_pages)
+    else:
+        pages = _iter_rest_pages(query, token, max_pages)
+    fetched = []
+    for page in pages:
+        # Snapshot before yielding: consumers merge counts into these records
+        fetched.append([dict(rec) for rec in page.values()])
+        yield page
+    # Only complete searches are cached
+    save_search_cache(key, fetched)
+
+def load_search_cache(key):
+    """Return cached result pages for a search key, or None if missing or stale."""
+    path = os.path.join(SEARCH_CACHE_DIR, f"{key}.json")
+    try:
+        if time.time() - os.path.getmtime(path) >= SEARCH_CACHE_TTL:
+            return None
+        with open(path, 'rb') as f:
+            raw = f.read()
+        pages = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        return pages if isinstance(pages, list) else None
+    except Exception:
+        return None
+
+def save_search_cache(key, pages):
+    try:
+        os.makedirs(SEARCH_CACHE_DIR, exist_ok=True)
+        _atomic_write_json(os.path.join(SEARCH_CACHE_DIR, f"{key}.json"), pages)
+        _prune_search_cache()
+        return True
+    except Exception:
+        return False
+
+def _prune_search_cache():
+    """Evict least recently used cache files once the directory exceeds its size budget."""
+    entries = [e for e in os.scandir(SEARCH_CACHE_DIR) if e.is_file() and e.name.endswith(".json")]
+    stats = [(e.path, e.stat()) for e in entries]
+    total = sum(st.st_size for _, st in stats)
+    if total <= SEARCH_CACHE_MAX_BYTES:
+        return
+    for path, st in sorted(stats, key=lambda x: x[1].st_atime):
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= st.st_size
+        if total <= SEARCH_CACHE_MAX_BYTES:
+            break
+
+def _reserve_request(resource):
+    """Take one request from the shared budget, sleeping until reset when it runs low.
+
+    GitHub reports each endpoint category separately (X-RateLimit-Resource), so
+    the stricter search budget is tracked apart from GraphQL. The lock is held
+    while sleeping, so other workers queue behind the one that is waiting
+    instead of spending the last few requests at once.
+    """
+    with _RATE_LIMIT_LOCK:
+        state = _RATE_LIMITS.get(resource)
+        if state is None:
+            return
+        if state[0] < RATE_LIMIT_LOW:
+            time.sleep(min(max(0, state[1] - time.time()), MAX_RATE_LIMIT_WAIT))
+            # Unknown again until the next response reports the new window
+            del _RATE_LIMITS[resource]
+            return
+        # Count requests in flight before their responses report them
+        state[0] -= 1
+
+def _record_rate_limit(resource, resp):
+    """Update the shared budget from a response's X-RateLimit headers."""
+    try:
+        remaining = int(resp.headers["X-RateLimit-Remaining"])
+        reset = int(resp.headers["X-RateLimit-Reset"])
+    except (KeyError, ValueError):
+        return
+    with _RATE_LIMIT_LOCK:
+        state = _RATE_LIMITS.get(resource)
+        if state is None or reset > state[1]:
+            _RATE_LIMITS[resource] = [remaining, reset]
+        elif reset == state[1]:
+            # Responses can arrive out of order; keep the lowest count seen
+            state[0] = min(state[0], remaining)
+
+def _is_rate_limited(resp):
+    """True for the 403/429 GitHub returns once the budget is exhausted."""
+    return resp.status_code in (403, 429) and resp.headers.get("X-RateLimit-Remaining") == "0"
+
+def _send_with_budget(resource, send):
+    """Call send() to make one request against the shared rate-limit budget.
+
+    A response saying the budget is exhausted is retried once, after
+    _reserve_request has waited for the reset.
+    """
+    for attempt in range(2):
+        _reserve_request(resource)
+        resp = send()
+        _record_rate_limit(resource, resp)
+        if attempt or not _is_rate_limited(resp):
+            return resp
+        resp.close()
+
+def _new_record(full_name, html_url, description, pushed_at, fork, sample_issue):
+    """Build the flat per-repo record both search paths yield (issue count starts at 0)."""
+    return {
+        "full_name": full_name,
+        "html_url": html_url,
+        "description": description,
+        "pushed_at": pushed_at,
+        "pushed_date": pushed_at[:10],  # ISO 8601: YYYY-MM-DD before the "T"
+        "fork": fork,
+        "beginner_issues_count": 0,
+        "sample_issue": sample_issue
+    }
+
+def _iter_graphql_pages(query, token, max_pages):
+    """Run the issue search through GraphQL so repository fields arrive inline."""
+    headers = {"Authorization": f"bearer {token}"}
+    # Match the REST search's sort=updated&order=desc so both paths see the same 1000 results
+    variables = {"q": f"{query} sort:updated-desc", "cursor": None}
+    payload = {"query": SEARCH_QUERY, "variables": variables}
+    # Issues can shift between pages while paginating by "updated"; count each once
+    seen = set()
+
     for page in range(1, max_pages + 1):
-        params = {"q": query, "sort": "updated", "order": "desc", "per_page": per_page, "page": page}
-        resp = requests.get(url, headers=gh_headers(token), params=params, timeout=30)
+        repos_dict = {}
+        resp = _send_with_budget("graphql", lambda: _SESSION.post(
+            GRAPHQL_URL, headers=headers, json=payload, timeout=30))
         resp.raise_for_status()
-        data = resp.json()
+        body = parse_json(resp)
+        if body.get("errors") and not body.get("data"):
+            raise RuntimeError(body["errors"][0].get("message", "GraphQL search failed"))
+        search = body["data"]["search"]
+
+        for node in search.get("nodes") or []:
+            repo = node.get("repository") if node else None
+            if not repo or node.get("url") in seen:
+                continue
+            seen.add(node.get("url"))
+            full_name = repo["nameWithOwner"]
+            rec = repos_dict.get(full_name)
+            if rec is None:
+                # "Last Update" is the issue's update time, as on the REST path
+                repos_dict[full_name] = rec = _new_record(
+                    full_name,
+                    repo.get("url") or f"https://github.com/{full_name}",
+                    repo.get("description") or "",
+                    node.get("updatedAt") or "",
+                    bool(repo.get("isFork")),
+                    node.get("url"))
+
+            rec["beginner_issues_count"] += 1
+
+        yield repos_dict
+
+        page_info = search.get("pageInfo") or {}
+        if not page_info.get("hasNextPage") or page >= max_pages:
+            break
+        variables["cursor"] = page_info.get("endCursor")
+
+def _iter_rest_pages(query, token, max_pages):
+    """Run the issue search through the REST API (no token required, no descriptions)."""
+    url = "https://api.github.com/search/issues"
+    per_page = 100
+    effective_pages = max_pages
+    params = {"q": query, "sort": "updated", "order": "desc", "per_page": per_page}
+    base_headers = gh_headers(token)
+    # Issues can shift between pages while paginating by "updated"; count each once
+    seen = set()
+    
+    for page in range(1, max_pages + 1):
+        repos_dict = {}
+        params["page"] = page
+        headers = base_headers
+        # Conditional request: an unchanged page comes back as a 304 that costs no rate limit
+        cache_key = (query, page)
+        with _ETAG_LOCK:
+            cached = _ETAG_CACHE.get(cache_key)
+        if cached:
+            headers = dict(base_headers, **{"If-None-Match": cached[0]})
+        resp = _send_with_budget("search", lambda: _SESSION.get(
+            url, headers=headers, params=params, timeout=30, stream=True))
+        with resp:
+            if resp.status_code == 304 and cached:
+                _, data, has_next = cached
+            else:
+                resp.raise_for_status()
+                data = parse_search_page(resp)
+                # requests parses the Link header; no rel="next" means this is the last page
+                has_next = "next" in resp.links
+                etag = resp.headers.get("ETag")
+                if etag:
+                    with _ETAG_LOCK:
+                        _ETAG_CACHE.pop(cache_key, None)
+                        if len(_ETAG_CACHE) >= ETAG_CACHE_SIZE:
+                            _ETAG_CACHE.pop(next(iter(_ETAG_CACHE)))
+                        _ETAG_CACHE[cache_key] = (etag, data, has_next)
         items = data.get("items", [])
+        if page == 1:
+            # The first page reports the total, so we know exactly how many pages to fetch
+            total = min(data.get("total_count", 0), SEARCH_RESULT_CAP)
+            effective_pages = min(max_pages, math.ceil(total / per_page))
         
         for issue in items:
             repo_url = issue.get("repository_url")
             if not repo_url:
                 continue
+            issue_id = issue.get("id")
+            if issue_id is not None:
+                if issue_id in seen:
+                    continue
+                seen.add(issue_id)
             
-            # Parse repo info from URL
-            parts = repo_url.split("/")
-            if len(parts) >= 2:
-                owner = parts[-2]
-                repo_name = parts[-1]
-                full_name = f"{owner}/{repo_name}"
-            else:
+            # repository_url is "https://api.github.com/repos/{owner}/{repo}"
+            if not repo_url.startswith(_REPOS_API_PREFIX):
+                continue
+            full_name = repo_url[_REPOS_API_PREFIX_LEN:]
+            if full_name.count("/") != 1:
                 continue
             
-            if full_name not in repos_dict:
-                # Extract description directly from issue's repository data (no extra API call!)
-                # GitHub's issue search includes basic repo info in each issue
-                description = ""
-                # Try to get description from the issue payload if available
-                # Note: The search API doesn't always include this, so we'll still have fallback fetching
-                
-                repo_info = {
-                    "full_name": full_name,
-                    "html_url": f"https://github.com/{full_name}",
-                    "description": description,
-                    "pushed_at": issue.get("updated_at", ""),
-                    "fork": False
-                }
-                repos_dict[full_name] = {
-                    "repo_info": repo_info,
-                    "issues_count": 0,
-                    "sample_issue": issue.get("html_url")
-                }
+            rec = repos_dict.get(full_name)
+            if rec is None:
+                # The REST search payload has no repository description
+                repos_dict[full_name] = rec = _new_record(
+                    full_name,
+                    f"https://github.com/{full_name}",
+                    "",
+                    issue.get("updated_at") or "",
+                    False,
+                    issue.get("html_url"))
             
-            repos_dict[full_name]["issues_count"] += 1
+            rec["beginner_issues_count"] += 1
         
-        if len(items) < per_page:
-            break
+        yield repos_dict
         
-        time.sleep(0.2)
-    
-    return repos_dict
+        if not has_next or len(items) < per_page or page >= effective_pages:
+            break
 
 # -------------------------
 # GUI Implementation
@@ -207,18 +626,37 @@ class App:
         
         self._setup_styles()
         
-        self.all_results = []
-        self._desc_cache = {}
+        # (sorted records, page count), replaced as one tuple so the Tk thread
+        # never pairs a new result list with the previous page count
+        self._published = ([], 0)
+        self._desc_cache = load_desc_cache()
+        self._desc_flush_pending = False
+        self._refresh_pending = False
+        self._refresh_timer = None
         self.current_page = 0
-        self._tag_to_url = {}
-        self._lock = threading.Lock()
+        self._cache_day = utc_today()
+        # Text line number -> URL for the rendered page's titles and issue links
+        self._title_lines = {}
+        self._issue_lines = {}
+        self._page_cache = (None, {})
+        self._rendered = (None, -1, None)  # (result list, page, tag label) on screen
+        # Worker threads never touch Tk directly: they post (kind, payload)
+        # messages here and _poll dispatches them on the Tk thread
+        self._msgq = queue.Queue()
+        self._closing = False
+        root.protocol("WM_DELETE_WINDOW", self._on_close)
         
         self.custom_labels = load_labels()
         
         # Language selection vars
         self.lang_vars = {}
+        self._selected_langs = set()
         for lang in TOP_LANGUAGES:
-            self.lang_vars[lang] = tk.BooleanVar(value=False)
+            var = tk.BooleanVar(value=False)
+            # Track checked languages as they toggle so searches needn't poll every var
+            var.trace_add("write", lambda *_, L=lang, v=var: (
+                self._selected_langs.add(L) if v.get() else self._selected_langs.discard(L)))
+            self.lang_vars[lang] = var
         self.custom_lang_var = tk.StringVar(value="")
         
         # Tag selection vars
@@ -263,7 +701,7 @@ class App:
         self.lang_frame = tk.Frame(main_container, bg="white", relief=tk.FLAT, bd=0)
         self.lang_frame.pack(fill=tk.X, pady=(0, 5))
         self.lang_frame.pack_forget()
-        self._setup_languages()
+        self._build_languages_once()
         
         # Compact controls panel
         self.controls_frame = tk.Frame(main_container, bg="white", relief=tk.FLAT, bd=0, padx=8, pady=6)
@@ -353,7 +791,10 @@ class App:
         self.results.tag_configure("meta", foreground="#7f8c8d", font=("Segoe UI", 8))
         self.results.tag_configure("issue_link", foreground="#e67e22", font=("Segoe UI", 8), underline=True)
         self.results.tag_configure("separator", foreground="#bdc3c7")
-        self.results.tag_bind("issue_link", "<Button-1>", self._on_issue_link_click)
+        self.results.tag_bind("title", "<Button-1>", self._on_link_click)
+        self.results.tag_bind("title", "<Enter>", lambda e: self.results.config(cursor="hand2"))
+        self.results.tag_bind("title", "<Leave>", lambda e: self.results.config(cursor="arrow"))
+        self.results.tag_bind("issue_link", "<Button-1>", self._on_link_click)
         self.results.tag_bind("issue_link", "<Enter>", lambda e: self.results.config(cursor="hand2"))
         self.results.tag_bind("issue_link", "<Leave>", lambda e: self.results.config(cursor="arrow"))
         self.results.config(state=tk.DISABLED, cursor="arrow")
@@ -379,18 +820,16 @@ class App:
                                    activebackground="#2980b9", activeforeground="white")
         self.next_btn.pack(side=tk.RIGHT, padx=3)
 
+        self.root.after(50, self._poll)
+
     def _setup_styles(self):
         """Setup ttk widget styles."""
         style = ttk.Style()
         style.theme_use('clam')
         style.configure("Custom.TEntry", font=("Segoe UI", 9), fieldbackground="white", borderwidth=1)
 
-    def _setup_languages(self):
-        """Setup language selector checkboxes in lang_frame."""
-        # Clear existing widgets
-        for widget in self.lang_frame.winfo_children():
-            widget.destroy()
-        
+    def _build_languages_once(self):
+        """Build language selector checkboxes in lang_frame (called once from __init__)."""
         # Create a container for grid layout
         lang_container = tk.Frame(self.lang_frame, bg="white", padx=8, pady=6)
         lang_container.pack(fill=tk.X)
@@ -412,72 +851,21 @@ class App:
     
     def _toggle_languages(self):
         """Toggle visibility of language selector."""
-        self.lang_expanded = not self.lang_expanded
-        if self.lang_expanded:
+        self._show_languages(not self.lang_expanded)
+
+    def _show_languages(self, visible):
+        """Show or hide the language selector without rebuilding its widgets."""
+        self.lang_expanded = visible
+        if visible:
             self.lang_frame.pack(fill=tk.X, pady=(0, 5), before=self.controls_frame)
             self.lang_toggle_btn.config(text="▲ Languages (click to hide)")
         else:
             self.lang_frame.pack_forget()
             self.lang_toggle_btn.config(text="▼ Languages (click to show)")
 
-    def _fetch_descriptions(self, token):
-        """Fetch missing repository descriptions in the background and refresh current page."""
-        max_fetch = 60 if token else 30  # avoid hitting rate limits when unauthenticated
-        fetched = 0
-        for r in self.all_results:
-            if fetched >= max_fetch:
-                break
-            if r.get("description"):
-                continue
-            full = r.get("full_name", "")
-            if not full or "/" not in full:
-                continue
-            owner, repo = full.split("/", 1)
-            desc = fetch_repo_description(owner, repo, token, timeout=4)
-            if desc:
-                r["description"] = desc
-                self._desc_cache[full] = desc
-                fetched += 1
-                # Refresh UI for current page to show newly fetched descriptions
-                current_page = self.current_page
-                self.root.after(0, lambda cp=current_page: self._refresh_if_page(cp))
-
-    def _prefetch_first_page_descriptions(self, results, token):
-        """Synchronously fetch descriptions for the first page (small batch) to show immediate content."""
-        if not token:
-            # Skip prefetch without token to avoid rate limits
-            self._append_status("Note: Add GitHub token for repository descriptions")
-            return
-            
-        first_batch = results[:ITEMS_PER_PAGE]
-        fetch_limit = min(len(first_batch), 10)  # reduced cap to conserve rate limit
-        fetched = 0
-        
-        for r in first_batch[:fetch_limit]:
-            if r.get("description"):
-                continue
-            full = r.get("full_name", "")
-            if not full or "/" not in full:
-                continue
-            if full in self._desc_cache:
-                r["description"] = self._desc_cache[full]
-                continue
-            owner, repo = full.split("/", 1)
-            desc = fetch_repo_description(owner, repo, token, timeout=3)
-            if desc:
-                r["description"] = desc
-                self._desc_cache[full] = desc
-                fetched += 1
-            time.sleep(0.1)  # Small delay to avoid hammering API
-
-    def _refresh_if_page(self, page_index):
-        """Re-render current page only if still on the same page index."""
-        if self.current_page == page_index:
-            self._display_current_page()
-
     def on_fetch(self):
         # Get selected languages
-        selected_langs = [lang for lang, var in self.lang_vars.items() if var.get()]
+        selected_langs = [lang for lang in TOP_LANGUAGES if lang in self._selected_langs]
         
         # Add custom language if provided
         custom_lang = self.custom_lang_var.get().strip()
@@ -492,6 +880,21 @@ class App:
                 messagebox.showwarning("No Tag", "Please enter a custom tag or select a pre-made tag!")
                 return
         
+        # Read the remaining inputs here: the worker thread must not touch Tk
+        # Raw entry text: IntVar.get() raises TclError here on a blank or non-numeric
+        # field; the worker's int() reports that in the results pane instead
+        days_text = self.days_entry.get()
+        token_entry = self.token_var.get().strip()
+        custom_terms = self.custom_terms_var.get().strip()
+        
+        # Cached search dates are only valid for the day they were computed
+        today = utc_today()
+        if today != self._cache_day:
+            iso_date_days_ago.cache_clear()
+            self._cache_day = today
+        
+        self._rendered = (None, -1, None)
+        
         # Disable UI
         self.fetch_btn.config(state=tk.DISABLED)
         self.prev_btn.config(state=tk.DISABLED)
@@ -501,33 +904,20 @@ class App:
         self.results.insert(tk.END, "🔄 Starting search...\n\nFetching repositories and checking for open beginner issues...\n")
         self.results.config(state=tk.DISABLED)
         self.status_var.set("Searching GitHub...")
-        self.all_results = []
+        self._published = ([], 0)
         self.current_page = 0
-        # Start background thread
-        t = threading.Thread(target=self._fetch_thread, daemon=True)
-        t.start()
+        # Daemon thread: closing the window mustn't wait for requests in flight
+        threading.Thread(target=self._fetch_thread, daemon=True,
+                         args=(days_text, token_entry, selected_langs, selected_tag, custom_terms)).start()
 
-    def _fetch_thread(self):
+    def _fetch_thread(self, days_text, token_entry, selected_langs, selected_tag, custom_terms):
+        """Run a search with the inputs on_fetch read from the form."""
         try:
-            days = int(self.days_var.get())
-            token_entry = self.token_var.get().strip()
+            days = int(days_text)
             env_token = os.getenv("GITHUB_TOKEN") or ""
             token = token_entry or env_token
             save_token(token_entry)
             
-            # Get selected languages
-            selected_langs = [lang for lang, var in self.lang_vars.items() if var.get()]
-            custom_lang = self.custom_lang_var.get().strip()
-            if custom_lang and custom_lang not in selected_langs:
-                selected_langs.append(custom_lang)
-            
-            # Get selected tag
-            selected_tag = self.tag_var.get()
-            if selected_tag == "__CUSTOM__":
-                selected_tag = self.custom_tag_var.get().strip()
-            
-            custom_terms = self.custom_terms_var.get().strip()
-            
             lang_desc = "all languages" if not selected_langs else ", ".join(selected_langs)
             
             self._append_status(f"Searching for OPEN issues with tag: {selected_tag}")
@@ -537,50 +927,89 @@ class App:
                 self._append_result(f"🔎 Custom terms: {custom_terms}\n")
             self._append_result("\n")
             
-            repos_dict = search_open_beginner_issues(selected_langs, days, [selected_tag], custom_terms, token, max_pages=10)
+            # Show the first result page as soon as it arrives and keep loading
+            # the remaining pages in this thread, re-rendering as they land
+            repos_dict = {}
+            pages = iter_search_pages(selected_langs, days, [selected_tag], custom_terms, token, max_pages=10)
+            for page in pages:
+                if self._closing:
+                    return
+                self._apply_desc_cache(page, repos_dict)
+                merge_search_page(repos_dict, page)
+                if not repos_dict:
+                    continue
+                first_render = not self._published[0]
+                self._show_results(repos_dict)
+                self._msgq.put(("render" if first_render else "refresh", None))
+                self._append_status(f"Found {len(repos_dict)} repos so far, loading more...")
             
             if not repos_dict:
                 self._append_result("No repositories found with OPEN issues matching your criteria.\n")
                 self._done("No results found")
                 return
             
-            self._append_result(f"✓ Found {len(repos_dict)} repositories with matching open issues!\n\n")
-            self._append_status("Processing results...")
-            
-            filtered_results = []
-            for full_name, data in repos_dict.items():
-                repo_info = data["repo_info"]
-                filtered_results.append({
-                    "full_name": repo_info["full_name"],
-                    "html_url": repo_info["html_url"],
-                    "description": repo_info["description"],
-                    "pushed_at": repo_info["pushed_at"],
-                    "fork": repo_info["fork"],
-                    "beginner_issues_count": data["issues_count"],
-                    "sample_issue": data["sample_issue"]
-                })
-            
-            filtered_results.sort(key=lambda x: x["beginner_issues_count"], reverse=True)
-            
-            # Prefetch descriptions for the first page so users see some details immediately
-            if token:
-                self._prefetch_first_page_descriptions(filtered_results, token)
-            else:
+            if not token:
                 self._append_status("Note: Add a GitHub token for repository descriptions (rate limit)")
-
-            self.all_results = filtered_results
-            self.current_page = 0
-            self._display_current_page()
-            # Start background description enrichment without blocking initial results
-            if token:
-                threading.Thread(target=self._fetch_descriptions, args=(token,), daemon=True).start()
-            self._done(f"Found {len(self.all_results)} repos with open issues")
+            self._done(f"Found {len(self._published[0])} repos with open issues")
             
         except Exception as e:
-            self._append_result(f"\n❌ Error: {e}\n")
+            self._msgq.put(("error", f"\n❌ Error: {e}\n"))
             self._done("Error occurred")
         finally:
-            self.root.after(0, lambda: self.fetch_btn.config(state=tk.NORMAL))
+            self._msgq.put(("finished", None))
+
+    def _apply_desc_cache(self, page, repos_dict):
+        """Sync descriptions for repos first seen on this page with the description cache
+        and store the truncated display_desc the renderer shows.
+
+        Only new repos are visited, so each page costs O(page) rather than O(all results).
+        """
+        now = time.time()
+        cache_changed = False
+        for full_name, data in page.items():
+            if full_name in repos_dict:
+                continue
+            if data["description"]:
+                # Remember descriptions from authenticated searches for later token-less ones
+                self._desc_cache[full_name] = {"description": data["description"], "fetched_at": now}
+                cache_changed = True
+            else:
+                entry = self._desc_cache.get(full_name)
+                if entry and now - entry["fetched_at"] < DESC_CACHE_TTL:
+                    data["description"] = entry["description"]
+            # The description is settled now; truncate it once rather than on every render
+            desc = data["description"] or "No description available"
+            data["display_desc"] = desc[:100] + "..." if len(desc) > 100 else desc
+        if cache_changed:
+            self._msgq.put(("desc_flush", None))
+
+    def _show_results(self, repos_dict):
+        """Publish the repos found so far, sorted by issue count."""
+        # Search records are already in display shape; rank them without copying
+        results = sorted(repos_dict.values(), key=lambda x: x["beginner_issues_count"], reverse=True)
+        self._published = (results, -(-len(results) // ITEMS_PER_PAGE))
+
+    def _schedule_refresh(self):
+        """Coalesce re-renders requested while results stream in into one every 250 ms."""
+        self._refresh_pending = True
+        if not self._refresh_timer:
+            self._refresh_timer = self.root.after(250, self._do_scheduled_refresh)
+
+    def _do_scheduled_refresh(self):
+        self._refresh_timer = None
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self._display_current_page()
+
+    def _schedule_desc_flush(self):
+        """Write the description cache to disk shortly after it changes."""
+        if not self._desc_flush_pending:
+            self._desc_flush_pending = True
+            self.root.after(2000, self._flush_desc_cache)
+
+    def _flush_desc_cache(self):
+        self._desc_flush_pending = False
+        save_desc_cache(dict(self._desc_cache))
 
     def prev_page(self):
         if self.current_page > 0:
@@ -588,162 +1017,166 @@ class App:
             self._display_current_page()
     
     def next_page(self):
-        total_pages = (len(self.all_results) + ITEMS_PER_PAGE - 1) // ITEMS_PER_PAGE
-        if self.current_page < total_pages - 1:
+        if self.current_page < self._published[1] - 1:
             self.current_page += 1
             self._display_current_page()
     
     def _display_current_page(self):
-        if not self.all_results:
+        results, total_pages = self._published
+        if not results:
             return
         
-        start_idx = self.current_page * ITEMS_PER_PAGE
-        end_idx = min(start_idx + ITEMS_PER_PAGE, len(self.all_results))
-        page_results = self.all_results[start_idx:end_idx]
-        
-        total_pages = (len(self.all_results) + ITEMS_PER_PAGE - 1) // ITEMS_PER_PAGE
+        page_index = self.current_page
+        start_idx = page_index * ITEMS_PER_PAGE
+        end_idx = min(start_idx + ITEMS_PER_PAGE, len(results))
         
         # Get selected tag for display
         selected_tag = self.tag_var.get()
         if selected_tag == "__CUSTOM__":
             selected_tag = self.custom_tag_var.get().strip() or "N/A"
         tags_display = selected_tag
-
-        # Ensure descriptions for visible items (fetch quickly in background)
-        token = self.token_var.get().strip() or os.getenv("GITHUB_TOKEN")
-        threading.Thread(target=self._ensure_page_descriptions, args=(page_results, token, self.current_page), daemon=True).start()
         
-        def _render():
-            self.results.config(state=tk.NORMAL)
-            self.results.delete("1.0", tk.END)
-            self._tag_to_url.clear()
+        # Navigating back to what is already on screen is a no-op
+        rendered_results, rendered_page, rendered_tags = self._rendered
+        if rendered_results is results and rendered_page == page_index and rendered_tags == tags_display:
+            return
+        
+        def _build_page():
+            """Return (insert args, title lines, issue lines) for this page.
+
+            Insert args interleave text and tag tuples; the line dicts map Text
+            line numbers to the URL rendered there.
+            """
+            args = []
+            title_lines = {}
+            issue_lines = {}
+            line = 1
             
             # Page header
-            page_header = f"✓ Showing {start_idx + 1}-{end_idx} of {len(self.all_results)} repositories with open issues\n"
+            page_header = f"✓ Showing {start_idx + 1}-{end_idx} of {len(results)} repositories with open issues\n"
             page_header += f"📋 Searched tags: {tags_display}\n"
             page_header += "─" * 100 + "\n\n"
-            self.results.insert(tk.END, page_header, ("meta",))
+            args.extend((page_header, ("meta",)))
+            line += 4
             
-            for i, r in enumerate(page_results, start=start_idx + 1):
-                # Repository title (clickable)
-                title = f"#{i}  {r['full_name']}"
-                tag = f"title_{i}"
-                self.results.insert(tk.END, title + "\n", ("title", tag))
-                self._tag_to_url[tag] = r["html_url"]
-                self.results.tag_bind(tag, "<Button-1>", self._on_title_click)
-                self.results.tag_bind(tag, "<Enter>", lambda e: self.results.config(cursor="hand2"))
-                self.results.tag_bind(tag, "<Leave>", lambda e: self.results.config(cursor="arrow"))
-                
-                # Use cached description if available
-                if not r.get("description") and r.get("full_name") in self._desc_cache:
-                    r["description"] = self._desc_cache[r["full_name"]]
-
-                desc = r["description"] or "No description available"
-                if len(desc) > 100:
-                    desc = desc[:100] + "..."
-                self.results.insert(tk.END, f"    📝 {desc}\n", ("description",))
+            for i, r in enumerate(results[start_idx:end_idx], start=start_idx + 1):
+                # Repository title (clickable via the class-level "title" binding)
+                args.extend((f"#{i}  {r['full_name']}\n", ("title",)))
+                title_lines[line] = r["html_url"]
+                line += 1
+
+                desc_line = f"    📝 {r['display_desc']}\n"
+                args.extend((desc_line, ("description",)))
+                line += desc_line.count("\n")
                 
-                pushed_date = r['pushed_at'].split('T')[0] if 'T' in r['pushed_at'] else r['pushed_at']
-                meta_line = f"    📅 Last Update: {pushed_date}  |  🎯 Open Issues: {r['beginner_issues_count']}\n"
-                self.results.insert(tk.END, meta_line, ("meta",))
+                meta_line = f"    📅 Last Update: {r['pushed_date']}  |  🎯 Open Issues: {r['beginner_issues_count']}\n"
+                args.extend((meta_line, ("meta",)))
+                line += 1
                 
                 if r.get("sample_issue"):
-                    issue_tag = f"issue_{i}"
-                    self.results.insert(tk.END, f"    🔗 ", ("meta",))
-                    self.results.insert(tk.END, "View an issue →", ("issue_link", issue_tag))
-                    self.results.insert(tk.END, "\n", ("meta",))
-                    self._tag_to_url[issue_tag] = r["sample_issue"]
+                    args.extend(("    🔗", ("meta",), " View an issue → ", ("issue_link",), "\n", ("meta",)))
+                    issue_lines[line] = r["sample_issue"]
+                    line += 1
                 
-                self.results.insert(tk.END, "\n" + "─" * 100 + "\n\n", ("separator",))
+                args.extend(("\n" + "─" * 100 + "\n\n", ("separator",)))
+                line += 3
+            return args, title_lines, issue_lines
+        
+        def _render():
+            # Rendered pages are cached per result list, so revisiting a page
+            # skips all formatting and is a single Tk insert
+            cache_owner, page_cache = self._page_cache
+            if cache_owner is not results:
+                page_cache = {}
+                self._page_cache = (results, page_cache)
+            key = (page_index, tags_display)
+            if key not in page_cache:
+                page_cache[key] = _build_page()
+            args, self._title_lines, self._issue_lines = page_cache[key]
             
+            self.results.config(state=tk.NORMAL)
+            self.results.delete("1.0", tk.END)
+            self.results.insert(tk.END, *args)
+            self._rendered = (results, page_index, tags_display)
             self.results.config(state=tk.DISABLED)
             
-            self.page_info_var.set(f"Page {self.current_page + 1} of {total_pages}")
-            self.results_title_var.set(f"{len(self.all_results)} Repositories Found")
+            self.page_info_var.set(f"Page {page_index + 1} of {total_pages}")
+            self.results_title_var.set(f"{len(results)} Repositories Found")
             
-            self.prev_btn.config(state=tk.NORMAL if self.current_page > 0 else tk.DISABLED)
-            self.next_btn.config(state=tk.NORMAL if self.current_page < total_pages - 1 else tk.DISABLED)
+            self.prev_btn.config(state=tk.NORMAL if page_index > 0 else tk.DISABLED)
+            self.next_btn.config(state=tk.NORMAL if page_index < total_pages - 1 else tk.DISABLED)
         
-        self.root.after(0, _render)
-
-    def _ensure_page_descriptions(self, items, token, page_index):
-        """Fetch descriptions for currently visible items and refresh that page when done."""
-        if not token:
-            # Don't fetch without token - will hit rate limits
-            return
-            
-        updated = False
-        for r in items:
-            full = r.get("full_name", "")
-            if not full or "/" not in full:
-                continue
-            if r.get("description"):
-                continue
-            if full in self._desc_cache:
-                r["description"] = self._desc_cache[full]
-                updated = True
-                continue
-            owner, repo = full.split("/", 1)
-            desc = fetch_repo_description(owner, repo, token, timeout=4)
-            if desc:
-                r["description"] = desc
-                self._desc_cache[full] = desc
-                updated = True
-            time.sleep(0.1)  # Small delay between requests
-        if updated:
-            self.root.after(0, lambda: self._refresh_if_page(page_index))
+        _render()
 
     def _append_status(self, text):
-        self.root.after(0, lambda: self.status_var.set(text))
+        self._msgq.put(("status", text))
 
     def _append_result(self, text):
-        def _append():
-            self.results.config(state=tk.NORMAL)
-            self.results.insert(tk.END, text)
-            self.results.see(tk.END)
-            self.results.config(state=tk.DISABLED)
-        self.root.after(0, _append)
-
-    def _on_title_click(self, event):
-        index = self.results.index(f"@{event.x},{event.y}")
-        tags = self.results.tag_names(index)
-        for t in tags:
-            if t.startswith("title_"):
-                url = self._tag_to_url.get(t)
-                if url:
-                    webbrowser.open(url)
-                return
-    
-    def _on_issue_link_click(self, event):
-        try:
-            index = self.results.index(f"@{event.x},{event.y}")
-            tags = self.results.tag_names(index)
-            # Look for issue tag in current position
-            for t in tags:
-                if t.startswith("issue_"):
-                    url = self._tag_to_url.get(t)
-                    if url:
-                        webbrowser.open(url)
-                        return
-            # If not found in current tags, try adjacent positions
-            for offset in [-1, 1]:
-                try:
-                    nearby_index = f"{index}{offset}c"
-                    nearby_tags = self.results.tag_names(nearby_index)
-                    for t in nearby_tags:
-                        if t.startswith("issue_"):
-                            url = self._tag_to_url.get(t)
-                            if url:
-                                webbrowser.open(url)
-                                return
-                except:
-                    pass
-        except Exception as e:
-            print(f"Error in _on_issue_link_click: {e}")
+        self._msgq.put(("result", text))
+
+    def _poll(self):
+        """Drain worker messages on the Tk thread, then check again in 50 ms."""
+        parts = []
+        while True:
+            try:
+                kind, payload = self._msgq.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "result":
+                parts.append(payload)
+                continue
+            # Flush pending text first so it stays ordered with renders
+            if parts:
+                self._insert_result_text("".join(parts))
+                parts = []
+            if kind == "status":
+                self.status_var.set(payload)
+            elif kind == "render":
+                self._display_current_page()
+            elif kind == "refresh":
+                self._schedule_refresh()
+            elif kind == "error":
+                # Render pending results now so a later refresh can't wipe the error text
+                if self._refresh_timer:
+                    self.root.after_cancel(self._refresh_timer)
+                self._do_scheduled_refresh()
+                self._insert_result_text(payload)
+            elif kind == "desc_flush":
+                self._schedule_desc_flush()
+            elif kind == "finished":
+                self.fetch_btn.config(state=tk.NORMAL)
+        if parts:
+            self._insert_result_text("".join(parts))
+        self.root.after(50, self._poll)
+
+    def _insert_result_text(self, text):
+        self.results.config(state=tk.NORMAL)
+        self.results.insert(tk.END, text)
+        self.results.see(tk.END)
+        self.results.config(state=tk.DISABLED)
+
+    def _on_link_click(self, event):
+        """Open the repository or issue URL rendered on the clicked line."""
+        line = int(self.results.index(f"@{event.x},{event.y}").split(".")[0])
+        url = self._title_lines.get(line) or self._issue_lines.get(line)
+        if url:
+            webbrowser.open(url)
 
     def _done(self, msg):
         self._append_status(msg)
 
+    def _on_close(self):
+        """Tell a running search to stop and close the window.
+
+        Search threads are daemons, so the process exits right away even if a
+        request is still in flight.
+        """
+        self._closing = True
+        # Don't lose descriptions still waiting for the delayed cache write
+        if self._desc_flush_pending:
+            self._flush_desc_cache()
+        self.root.destroy()
+
 def main():
     root = tk.Tk()
     app = App(root)